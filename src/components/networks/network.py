@@ -3,6 +3,7 @@ import warnings
 from ..component import ModelComponent
 from ..utilities import annualize, set_discount_rate, read_dict_value, perform_disjunct_relaxation, determine_variable_scaling, determine_constraint_scaling
 
+import numpy as np
 import pandas as pd
 import copy
 from pyomo.environ import *
@@ -306,21 +307,28 @@ class Network(ModelComponent):
 
     def write_netw_operation_results_to_group(self, h5_group, model_block):
 
+        nr_timesteps = len(self.set_t)
         for arc_name in model_block.set_arcs:
             arc = model_block.arc_block[arc_name]
             str = ''.join(arc_name)
             arc_group = h5_group.create_group(str)
 
-            arc_group.create_dataset("flow", data=[arc.var_flow[t].value for t in self.set_t])
-            arc_group.create_dataset("losses", data=[arc.var_losses[t].value for t in self.set_t])
+            arc_group.create_dataset("flow", data=np.fromiter((arc.var_flow[t].value for t in self.set_t),
+                                                              dtype=np.float64, count=nr_timesteps))
+            arc_group.create_dataset("losses", data=np.fromiter((arc.var_losses[t].value for t in self.set_t),
+                                                                dtype=np.float64, count=nr_timesteps))
 
             if arc.find_component('var_consumption_send'):
                 for car in model_block.set_consumed_carriers:
 
                     arc_group.create_dataset("consumption_send" + car,
-                                             data=[arc.var_consumption_send[t, car].value for t in self.set_t])
+                                             data=np.fromiter((arc.var_consumption_send[t, car].value
+                                                               for t in self.set_t),
+                                                              dtype=np.float64, count=nr_timesteps))
                     arc_group.create_dataset("consumption_receive" + car,
-                                             data=[arc.var_consumption_receive[t, car].value for t in self.set_t])
+                                             data=np.fromiter((arc.var_consumption_receive[t, car].value
+                                                               for t in self.set_t),
+                                                              dtype=np.float64, count=nr_timesteps))
 
     def scale_model(self, b_netw, model, configuration):
         """
@@ -821,7 +829,7 @@ class Network(ModelComponent):
         annualization_factor = annualize(discount_rate, economics.lifetime, fraction_of_year_modelled)
 
         def init_capex(const):
-            return sum(b_netw.arc_block[arc].var_capex for arc in arc_set) == \
+            return quicksum(b_netw.arc_block[arc].var_capex for arc in arc_set) == \
                    b_netw.var_capex
 
         b_netw.const_capex = Constraint(rule=init_capex)
@@ -840,13 +848,13 @@ class Network(ModelComponent):
             arc_set = b_netw.set_arcs
 
         def init_opex_fixed(const):
-            return b_netw.para_opex_fixed * sum(b_netw.arc_block[arc].var_capex_aux for arc in arc_set) == \
+            return b_netw.para_opex_fixed * quicksum(b_netw.arc_block[arc].var_capex_aux for arc in arc_set) == \
                    b_netw.var_opex_fixed
 
         b_netw.const_opex_fixed = Constraint(rule=init_opex_fixed)
 
         def init_opex_variable(const, t):
-            return sum(b_netw.arc_block[arc].var_opex_variable[t] for arc in b_netw.set_arcs) == \
+            return quicksum(b_netw.arc_block[arc].var_opex_variable[t] for arc in b_netw.set_arcs) == \
                    b_netw.var_opex_variable[t]
 
         b_netw.const_opex_var = Constraint(self.set_t, rule=init_opex_variable)
@@ -859,9 +867,9 @@ class Network(ModelComponent):
         """
 
         def init_inflow(const, t, car, node):
-            return b_netw.var_inflow[t, car, node] == sum(b_netw.arc_block[from_node, node].var_flow[t] - \
-                                                          b_netw.arc_block[from_node, node].var_losses[t]
-                                                          for from_node in b_netw.set_receives_from[node])
+            return b_netw.var_inflow[t, car, node] == quicksum(b_netw.arc_block[from_node, node].var_flow[t] -
+                                                               b_netw.arc_block[from_node, node].var_losses[t]
+                                                               for from_node in b_netw.set_receives_from[node])
 
         b_netw.const_inflow = Constraint(self.set_t, b_netw.set_netw_carrier, self.set_nodes, rule=init_inflow)
         return b_netw
@@ -873,8 +881,8 @@ class Network(ModelComponent):
         """
 
         def init_outflow(const, t, car, node):
-            return b_netw.var_outflow[t, car, node] == sum(b_netw.arc_block[node, to_node].var_flow[t] \
-                                                           for to_node in b_netw.set_sends_to[node])
+            return b_netw.var_outflow[t, car, node] == quicksum(b_netw.arc_block[node, to_node].var_flow[t]
+                                                                for to_node in b_netw.set_sends_to[node])
 
         b_netw.const_outflow = Constraint(self.set_t, b_netw.set_netw_carrier, self.set_nodes, rule=init_outflow)
         return b_netw
@@ -885,9 +893,9 @@ class Network(ModelComponent):
         """
 
         def init_netw_emissions(const, t):
-            return sum(b_netw.arc_block[arc].var_flow[t] for arc in b_netw.set_arcs) * \
+            return quicksum(b_netw.arc_block[arc].var_flow[t] for arc in b_netw.set_arcs) * \
                    b_netw.para_emissionfactor + \
-                   sum(b_netw.arc_block[arc].var_losses[t] for arc in b_netw.set_arcs) * \
+                   quicksum(b_netw.arc_block[arc].var_losses[t] for arc in b_netw.set_arcs) * \
                    b_netw.para_loss2emissions \
                    == b_netw.var_netw_emissions_pos[t]
 
@@ -901,10 +909,10 @@ class Network(ModelComponent):
 
         def init_network_consumption(const, t, car, node):
             return b_netw.var_consumption[t, car, node] == \
-                   sum(b_netw.arc_block[node, to_node].var_consumption_send[t, car]
-                       for to_node in b_netw.set_sends_to[node]) + \
-                   sum(b_netw.arc_block[from_node, node].var_consumption_receive[t, car]
-                       for from_node in b_netw.set_receives_from[node])
+                   quicksum(b_netw.arc_block[node, to_node].var_consumption_send[t, car]
+                            for to_node in b_netw.set_sends_to[node]) + \
+                   quicksum(b_netw.arc_block[from_node, node].var_consumption_receive[t, car]
+                            for from_node in b_netw.set_receives_from[node])
 
         b_netw.const_netw_consumption = Constraint(self.set_t, b_netw.set_consumed_carriers, self.set_nodes,
                                                    rule=init_network_consumption)
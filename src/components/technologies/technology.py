@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 from pyomo.gdp import *
 from warnings import warn
 from pyomo.environ import *
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 from ..component import ModelComponent
 from ..utilities import annualize, set_discount_rate, link_full_resolution_to_clustered, determine_variable_scaling, determine_constraint_scaling
@@ -196,21 +198,36 @@ class Technology(ModelComponent):
         h5_group.create_dataset("emissions_neg", data=[sum(model_block.var_tec_emissions_neg[t].value for t in self.set_t_full)])
 
     def write_tec_operation_results_to_group(self, h5_group, model_block):
+        """
+        Function to report time-dependent results of technologies after optimization
 
-        for car in model_block.set_input_carriers:
-            if model_block.find_component('var_input'):
-                h5_group.create_dataset(f'{car}_input', data=[model_block.var_input[t, car].value for t in self.set_t_full])
+        :param h5_group: h5 group to write to
+        :param model_block: technology model block
+        """
+        set_t = self.set_t_full
+        nr_timesteps = len(set_t)
+
+        if model_block.find_component('var_input'):
+            var_input = model_block.var_input
+            for car in model_block.set_input_carriers:
+                h5_group.create_dataset(f'{car}_input', data=np.fromiter((var_input[t, car].value for t in set_t),
+                                                                         dtype=np.float64, count=nr_timesteps))
+        var_output = model_block.var_output
         for car in model_block.set_output_carriers:
-            h5_group.create_dataset(f'{car}_output', data=[model_block.var_output[t, car].value for t in self.set_t_full])
-        h5_group.create_dataset("emissions_pos", data=[model_block.var_tec_emissions_pos[t].value for t in self.set_t_full])
-        h5_group.create_dataset("emissions_neg", data=[model_block.var_tec_emissions_neg[t].value for t in self.set_t_full])
-        if model_block.find_component('var_x'):
-            model_block.var_x.pprint()
-            h5_group.create_dataset("var_x", data=[0 if x is None else x for x in [model_block.var_x[t].value for t in self.set_t_full]])
-        if model_block.find_component('var_y'):
-            h5_group.create_dataset("var_y", data=[0 if x is None else x for x in [model_block.var_y[t].value for t in self.set_t_full]])
-        if model_block.find_component('var_z'):
-            h5_group.create_dataset("var_z", data=[0 if x is None else x for x in [model_block.var_z[t].value for t in self.set_t_full]])
+            h5_group.create_dataset(f'{car}_output', data=np.fromiter((var_output[t, car].value for t in set_t),
+                                                                      dtype=np.float64, count=nr_timesteps))
+        h5_group.create_dataset("emissions_pos", data=np.fromiter((model_block.var_tec_emissions_pos[t].value
+                                                                   for t in set_t),
+                                                                  dtype=np.float64, count=nr_timesteps))
+        h5_group.create_dataset("emissions_neg", data=np.fromiter((model_block.var_tec_emissions_neg[t].value
+                                                                   for t in set_t),
+                                                                  dtype=np.float64, count=nr_timesteps))
+        for var_name in ['var_x', 'var_y', 'var_z']:
+            var = model_block.find_component(var_name)
+            if var:
+                h5_group.create_dataset(var_name, data=np.fromiter((0 if x is None else x for x in
+                                                                    (var[t].value for t in set_t)),
+                                                                   dtype=np.float64, count=nr_timesteps))
 
     def scale_model(self, b_tec, model, configuration):
         """
@@ -402,12 +419,16 @@ class Technology(ModelComponent):
         else:
             b_tec.set_input_carriers = Set(initialize=performance_data['input_carrier'])
 
+            # scale bounds once per carrier, instead of once per index of var_input
+            input_bounds = {car: [tuple(bound) for bound in
+                                  (fitted_performance.bounds['input'][car] * size_max * rated_power).tolist()]
+                            for car in b_tec.set_input_carriers}
+
             def init_input_bounds(bounds, t, car):
                 if energyhub.model_information.clustered_data and not modelled_with_full_res:
-                    return tuple(
-                        fitted_performance.bounds['input'][car][sequence[t - 1] - 1, :] * size_max * rated_power)
+                    return input_bounds[car][sequence[t - 1] - 1]
                 else:
-                    return tuple(fitted_performance.bounds['input'][car][t - 1, :] * size_max * rated_power)
+                    return input_bounds[car][t - 1]
 
             b_tec.var_input = Var(set_t, b_tec.set_input_carriers, within=NonNegativeReals,
                                   bounds=init_input_bounds)
@@ -440,11 +461,16 @@ class Technology(ModelComponent):
 
         b_tec.set_output_carriers = Set(initialize=performance_data['output_carrier'])
 
+        # scale bounds once per carrier, instead of once per index of var_output
+        output_bounds = {car: [tuple(bound) for bound in
+                               (fitted_performance.bounds['output'][car] * size_max * rated_power).tolist()]
+                         for car in b_tec.set_output_carriers}
+
         def init_output_bounds(bounds, t, car):
             if energyhub.model_information.clustered_data and not modelled_with_full_res:
-                return tuple(fitted_performance.bounds['output'][car][sequence[t - 1] - 1, :] * size_max * rated_power)
+                return output_bounds[car][sequence[t - 1] - 1]
             else:
-                return tuple(fitted_performance.bounds['output'][car][t - 1, :] * size_max * rated_power)
+                return output_bounds[car][t - 1]
 
         b_tec.var_output = Var(set_t, b_tec.set_output_carriers, within=NonNegativeReals,
                                bounds=init_output_bounds)
@@ -461,8 +487,12 @@ class Technology(ModelComponent):
         b_tec.para_opex_variable = Param(domain=Reals, initialize=economics.opex_variable, mutable=True)
         b_tec.var_opex_variable = Var(set_t)
 
+        output_carriers = list(b_tec.set_output_carriers)
+        opex_coefs = [b_tec.para_opex_variable] * len(output_carriers)
+
         def init_opex_variable(const, t):
-            return sum(b_tec.var_output[t, car] for car in b_tec.set_output_carriers) * b_tec.para_opex_variable == \
+            return LinearExpression(constant=0, linear_coefs=opex_coefs,
+                                    linear_vars=[b_tec.var_output[t, car] for car in output_carriers]) == \
                    b_tec.var_opex_variable[t]
 
         b_tec.const_opex_variable = Constraint(set_t, rule=init_opex_variable)
@@ -565,8 +595,12 @@ class Technology(ModelComponent):
         sequence = energyhub.data.k_means_specs.full_resolution['sequence']
 
         if not (self.technology_model == 'RES') and not (self.technology_model == 'CONV4') and not  (self.technology_model == 'RES_CAP'):
+            input_bounds = {car: [tuple(bound) for bound in
+                                  (self.fitted_performance.bounds['input'][car] * size_max * rated_power).tolist()]
+                            for car in b_tec.set_input_carriers}
+
             def init_input_bounds(bounds, t, car):
-                return tuple(self.fitted_performance.bounds['input'][car][t - 1, :] * size_max * rated_power)
+                return input_bounds[car][t - 1]
 
             b_tec.var_input_aux = Var(set_t_clustered, b_tec.set_input_carriers, within=NonNegativeReals,
                                       bounds=init_input_bounds)
@@ -578,8 +612,12 @@ class Technology(ModelComponent):
                                                                                           b_tec.set_input_carriers)
             self.input = b_tec.var_input_aux
 
+        output_bounds = {car: [tuple(bound) for bound in
+                               (self.fitted_performance.bounds['output'][car] * size_max * rated_power).tolist()]
+                         for car in b_tec.set_output_carriers}
+
         def init_output_bounds(bounds, t, car):
-            return tuple(self.fitted_performance.bounds['output'][car][t - 1, :] * size_max * rated_power)
+            return output_bounds[car][t - 1]
 
         b_tec.var_output_aux = Var(set_t_clustered, b_tec.set_output_carriers, within=NonNegativeReals,
                                    bounds=init_output_bounds)
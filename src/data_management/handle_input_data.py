@@ -1,4 +1,5 @@
 import json
+import sys
 
 import pandas as pd
 import copy
@@ -398,42 +399,36 @@ class DataHandle:
         :return: None
         """
 
-        print('----- SET OF CARRIERS -----')
+        lines = ['----- SET OF CARRIERS -----']
         for car in self.topology.carriers:
-            print('- ' + car)
-        print('----- NODE DATA -----')
+            lines.append('- ' + car)
+        lines.append('----- NODE DATA -----')
         for node in self.node_data:
-            print('\t -----------------------------------------------------')
-            print('\t Nodename: ' + node)
-            print('\t\tNew technologies:')
+            lines.append('\t -----------------------------------------------------')
+            lines.append('\t Nodename: ' + node)
+            lines.append('\t\tNew technologies:')
             for tec in self.topology.technologies_new[node]:
-                print('\t\t - ' + tec)
-            print('\t\tExisting technologies:')
+                lines.append('\t\t - ' + tec)
+            lines.append('\t\tExisting technologies:')
             for tec in self.topology.technologies_existing[node]:
-                print('\t\t - ' + tec)
-            print('\t\tOther Node data:')
+                lines.append('\t\t - ' + tec)
+            lines.append('\t\tOther Node data:')
             for var in self.node_data[node].data:
-                print('\t\t\tAverage of ' + var + ':')
-                for ser in self.node_data[node].data[var]:
-                    avg = round(self.node_data[node].data[var][ser].mean(), 2)
-                    print('\t\t\t - ' + ser + ': ' + str(avg))
-        print('----- NETWORK DATA -----')
-        for netw in self.topology.networks_new:
-            print('\t -----------------------------------------------------')
-            print('\t' + netw)
-            connection = self.topology.networks_new[netw]['connection']
-            for from_node in connection:
-                for to_node in connection[from_node].index:
-                    if connection.at[from_node, to_node] == 1:
-                        print('\t\t\t' + from_node + ' - ' + to_node)
-        for netw in self.topology.networks_existing:
-            print('\t -----------------------------------------------------')
-            print('\t' + netw)
-            connection = self.topology.networks_existing[netw]['connection']
-            for from_node in connection:
-                for to_node in connection[from_node].index:
-                    if connection.at[from_node, to_node] == 1:
-                        print('\t\t\t' + from_node + ' - ' + to_node)
+                lines.append('\t\t\tAverage of ' + var + ':')
+                averages = self.node_data[node].data[var].mean().round(2)
+                for ser, avg in averages.items():
+                    lines.append('\t\t\t - ' + ser + ': ' + str(avg))
+        lines.append('----- NETWORK DATA -----')
+        for networks in [self.topology.networks_new, self.topology.networks_existing]:
+            for netw in networks:
+                lines.append('\t -----------------------------------------------------')
+                lines.append('\t' + netw)
+                connection = networks[netw]['connection']
+                connected = connection.stack().loc[lambda s: s == 1]
+                for from_node, to_node in connected.index:
+                    lines.append('\t\t\t' + from_node + ' - ' + to_node)
+
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def save(self, save_path):
         """
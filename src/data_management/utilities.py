@@ -13,13 +13,13 @@ from ..case_offshore_storage.res_cap import Res_Cap
 
 def save_object(data, save_path):
     """
-    Save object to path
+    Save object to path (using pickle protocol 5)
 
     :param data: object to save
     :param Path save_path: path to save object to
     """
     with open(save_path, 'wb') as handle:
-        pickle.dump(data, handle)
+        pickle.dump(data, handle, protocol=5)
 
 
 def load_object(load_path):
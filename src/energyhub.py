@@ -36,6 +36,19 @@ class EnergyHub:
     - Set of technologies at each node :math:`S_n, n \in N`
 
     """
+    __slots__ = ('configuration', 'model', 'scaled_model', 'topology', 'model_information', 'solution', 'solver',
+                 'data_storage', 'data', 'model_first_stage', 'solution_first_stage')
+
+    def __setstate__(self, state):
+        """
+        Restores an unpickled instance. Accepts the (None, slots) state of current instances and the plain dict state
+        of instances saved before __slots__ was declared.
+        """
+        if isinstance(state, tuple):
+            state = state[1]
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+
     def __init__(self, data, configuration):
         """
         Constructor of the energyhub class.
@@ -248,6 +261,7 @@ class EnergyHub:
         """
         Saves an instance of the energyhub instance to the specified path (using pickel/dill).
 
+        Pickle protocol 5 is used, which writes numpy arrays without intermediate copies.
         The object can later be loaded using into the work space using :func:`~load_energyhub_instance`
 
         :param str file_path: path to save
@@ -255,7 +269,7 @@ class EnergyHub:
         :return: None
         """
         with open(Path(save_path) / file_name, mode='wb') as file:
-            pickle.dump(self, file)
+            pickle.dump(self, file, protocol=5)
 
     def _define_solver_settings(self):
         """
@@ -339,13 +353,7 @@ class EnergyHub:
         Minimize costs at emission limit
         """
         emission_limit = self.configuration.optimization.emission_limit
-        if self.model.find_component('const_emission_limit'):
-            if self.configuration.solveroptions.solver == 'gurobi_persistent':
-                self.solver.remove_constraint(self.model.const_emission_limit)
-            self.model.del_component(self.model.const_emission_limit)
-        self.model.const_emission_limit = Constraint(expr=self.model.var_emissions_net <= emission_limit)
-        if self.configuration.solveroptions.solver == 'gurobi_persistent':
-            self.solver.add_constraint(self.model.const_emission_limit)
+        self._set_emission_limit(emission_limit)
         self._optimize_cost()
 
 
@@ -355,14 +363,27 @@ class EnergyHub:
         """
         self._optimize_emissions_net()
         emission_limit = self.model.var_emissions_net.value
+        self._set_emission_limit(emission_limit*1.01)
+        self._optimize_cost()
+
+    def _set_emission_limit(self, emission_limit):
+        """
+        Limits net emissions to emission_limit
+
+        The constraint is only constructed once. For subsequent limits (e.g. along the pareto front), only the mutable
+        parameter para_emission_limit is updated and the model is not reconstructed.
+        """
         if self.model.find_component('const_emission_limit'):
+            self.model.para_emission_limit = emission_limit
             if self.configuration.solveroptions.solver == 'gurobi_persistent':
                 self.solver.remove_constraint(self.model.const_emission_limit)
-            self.model.del_component(self.model.const_emission_limit)
-        self.model.const_emission_limit = Constraint(expr=self.model.var_emissions_net <= emission_limit*1.01)
-        if self.configuration.solveroptions.solver == 'gurobi_persistent':
-            self.solver.add_constraint(self.model.const_emission_limit)
-        self._optimize_cost()
+                self.solver.add_constraint(self.model.const_emission_limit)
+        else:
+            self.model.para_emission_limit = Param(domain=Reals, initialize=emission_limit, mutable=True)
+            self.model.const_emission_limit = Constraint(
+                expr=self.model.var_emissions_net <= self.model.para_emission_limit)
+            if self.configuration.solveroptions.solver == 'gurobi_persistent':
+                self.solver.add_constraint(self.model.const_emission_limit)
 
     def _solve_pareto(self):
         """
@@ -385,13 +406,7 @@ class EnergyHub:
         emission_limits = np.linspace(emissions_min, emissions_max, num=pareto_points)
         for pareto_point in range(0, pareto_points):
             self.model_information.pareto_point += 1
-            if self.configuration.solveroptions.solver == 'gurobi_persistent':
-                self.solver.remove_constraint(self.model.const_emission_limit)
-            self.model.del_component(self.model.const_emission_limit)
-            self.model.const_emission_limit = Constraint(
-                expr=self.model.var_emissions_net <= emission_limits[pareto_point]*1.005)
-            if self.configuration.solveroptions.solver == 'gurobi_persistent':
-                self.solver.add_constraint(self.model.const_emission_limit)
+            self._set_emission_limit(emission_limits[pareto_point]*1.005)
             self._optimize_cost()
 
     def _solve_monte_carlo(self, objective):
@@ -527,12 +542,7 @@ class EnergyHub:
             summary_dict = write_optimization_results_to_h5(self, result_folder_path)
 
             # Write Summary
-            if not os.path.exists(save_summary_path):
-                summary_df = pd.DataFrame(data=summary_dict, index=[0])
-                summary_df.to_excel(save_summary_path, index=False, sheet_name="Summary")
-            else:
-                summary_existing = pd.read_excel(save_summary_path)
-                pd.concat([summary_existing, pd.DataFrame(data=summary_dict, index=[0])]).to_excel(save_summary_path, index=False, sheet_name="Summary")
+            write_summary_to_excel(summary_dict, save_summary_path)
 
 
         print('Solving model completed in ' + str(round(time.time() - start)) + ' s')
@@ -691,45 +701,13 @@ class EnergyHub:
         import_prices = self.data.node_data[node].data['import_prices'][car]
         b_node = self.model.node_blocks[node]
 
+        # Update parameter
         for t in set_t:
-            # Update parameter
-            b_node.para_import_price[t, car] = import_prices[t-1] * sd_random
-
-            # Remove constraint (from persistent solver and from model)
-            self.solver.remove_constraint(model.const_node_cost)
-            self.model.del_component(model.const_node_cost)
+            b_node.para_import_price[t, car] = import_prices[t - 1] * sd_random
 
-            # Add constraint again
-            nr_timesteps_averaged = self.model_information.averaged_data_specs.nr_timesteps_averaged
-
-            def init_node_cost(const):
-                tec_capex = sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_capex
-                                    for tec in model.node_blocks[node].set_tecsAtNode)
-                                for node in model.set_nodes)
-                tec_opex_variable = sum(sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_opex_variable[t] *
-                                                nr_timesteps_averaged
-                                                for tec in model.node_blocks[node].set_tecsAtNode)
-                                            for t in set_t)
-                                        for node in model.set_nodes)
-                tec_opex_fixed = sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_opex_fixed
-                                         for tec in model.node_blocks[node].set_tecsAtNode)
-                                     for node in model.set_nodes)
-                import_cost = sum(sum(sum(model.node_blocks[node].var_import_flow[t, car] *
-                                          model.node_blocks[node].para_import_price[t, car] *
-                                          nr_timesteps_averaged
-                                          for car in model.node_blocks[node].set_carriers)
-                                      for t in set_t)
-                                  for node in model.set_nodes)
-                export_revenue = sum(sum(sum(model.node_blocks[node].var_export_flow[t, car] *
-                                             model.node_blocks[node].para_export_price[t, car] *
-                                             nr_timesteps_averaged
-                                             for car in model.node_blocks[node].set_carriers)
-                                         for t in set_t)
-                                     for node in model.set_nodes)
-                return tec_capex + tec_opex_variable + tec_opex_fixed + import_cost - export_revenue == model.var_node_cost
-
-            model.const_node_cost = Constraint(rule=init_node_cost)
-            self.solver.add_constraint(model.const_node_cost)
+        # Re-add constraint to persistent solver, the node cost expression holds the updated parameters
+        self.solver.remove_constraint(model.const_node_cost)
+        self.solver.add_constraint(model.const_node_cost)
 
 
     def _monte_carlo_export_prices(self, node, car):
@@ -745,45 +723,13 @@ class EnergyHub:
         export_prices = self.data.node_data[node].data['export_prices'][car]
         b_node = self.model.node_blocks[node]
 
+        # Update parameter
         for t in set_t:
-            # Update parameter
             b_node.para_export_price[t, car] = export_prices[t - 1] * sd_random
 
-            # Remove constraint (from persistent solver and from model)
-            self.solver.remove_constraint(model.const_node_cost)
-            self.model.del_component(model.const_node_cost)
-
-            # Add constraint again
-            nr_timesteps_averaged = self.model_information.averaged_data_specs.nr_timesteps_averaged
-
-            def init_node_cost(const):
-                tec_capex = sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_capex
-                                    for tec in model.node_blocks[node].set_tecsAtNode)
-                                for node in model.set_nodes)
-                tec_opex_variable = sum(sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_opex_variable[t] *
-                                                nr_timesteps_averaged
-                                                for tec in model.node_blocks[node].set_tecsAtNode)
-                                            for t in set_t)
-                                        for node in model.set_nodes)
-                tec_opex_fixed = sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_opex_fixed
-                                         for tec in model.node_blocks[node].set_tecsAtNode)
-                                     for node in model.set_nodes)
-                import_cost = sum(sum(sum(model.node_blocks[node].var_import_flow[t, car] *
-                                          model.node_blocks[node].para_import_price[t, car] *
-                                          nr_timesteps_averaged
-                                          for car in model.node_blocks[node].set_carriers)
-                                      for t in set_t)
-                                  for node in model.set_nodes)
-                export_revenue = sum(sum(sum(model.node_blocks[node].var_export_flow[t, car] *
-                                             model.node_blocks[node].para_export_price[t, car] *
-                                             nr_timesteps_averaged
-                                             for car in model.node_blocks[node].set_carriers)
-                                         for t in set_t)
-                                     for node in model.set_nodes)
-                return tec_capex + tec_opex_variable + tec_opex_fixed + import_cost - export_revenue == model.var_node_cost
-
-            model.const_node_cost = Constraint(rule=init_node_cost)
-            self.solver.add_constraint(model.const_node_cost)
+        # Re-add constraint to persistent solver, the node cost expression holds the updated parameters
+        self.solver.remove_constraint(model.const_node_cost)
+        self.solver.add_constraint(model.const_node_cost)
 
     def _delete_objective(self):
         """
@@ -41,33 +41,33 @@ def add_energybalance(energyhub):
 
     if configuration.energybalance.copperplate:
         def init_energybalance_global(const, t, car):
-            tec_output = sum(sum(
+            tec_output = quicksum(quicksum(
                 model.node_blocks[node].tech_blocks_active[tec].var_output[t, car] for tec in
                 model.node_blocks[node].set_tecsAtNode if
                 car in model.node_blocks[node].set_carriers and model.node_blocks[node].tech_blocks_active[
                     tec].set_output_carriers) for node in model.node_blocks)
 
-            tec_input = sum(sum(
+            tec_input = quicksum(quicksum(
                 model.node_blocks[node].tech_blocks_active[tec].var_input[t, car] for tec in
                 model.node_blocks[node].set_tecsAtNode if
                 car in model.node_blocks[node].set_carriers and model.node_blocks[node].tech_blocks_active[
                     tec].set_input_carriers) for node in model.node_blocks)
 
-            import_flow = sum(model.node_blocks[node].var_import_flow[t, car] for node in model.node_blocks if
-                              car in model.node_blocks[node].set_carriers)
+            import_flow = quicksum(model.node_blocks[node].var_import_flow[t, car] for node in model.node_blocks if
+                                   car in model.node_blocks[node].set_carriers)
 
-            export_flow = sum(model.node_blocks[node].var_export_flow[t, car] for node in model.node_blocks if
-                              car in model.node_blocks[node].set_carriers)
+            export_flow = quicksum(model.node_blocks[node].var_export_flow[t, car] for node in model.node_blocks if
+                                   car in model.node_blocks[node].set_carriers)
 
-            demand = sum(model.node_blocks[node].para_demand[t, car] for node in model.node_blocks if
-                         car in model.node_blocks[node].set_carriers)
+            demand = quicksum(model.node_blocks[node].para_demand[t, car] for node in model.node_blocks if
+                              car in model.node_blocks[node].set_carriers)
 
-            gen_prod = sum(model.node_blocks[node].var_generic_production[t, car] for node in model.node_blocks if
-                           car in model.node_blocks[node].set_carriers)
+            gen_prod = quicksum(model.node_blocks[node].var_generic_production[t, car] for node in model.node_blocks if
+                                car in model.node_blocks[node].set_carriers)
 
             if configuration.energybalance.violation >= 0:
-                violation = sum(model.var_violation[t, car, node] for node in model.node_blocks if
-                                car in model.node_blocks[node].set_carriers)
+                violation = quicksum(model.var_violation[t, car, node] for node in model.node_blocks if
+                                     car in model.node_blocks[node].set_carriers)
             else:
                 violation = 0
 
@@ -80,16 +80,25 @@ def add_energybalance(energyhub):
         model.const_energybalance = Constraint(set_t, model.set_carriers, rule=init_energybalance_global)
 
     else:
+        # collect the technology variables per node and carrier once, instead of checking the carriers of all
+        # technologies at a node in every time step
+        tec_output_vars = {}
+        tec_input_vars = {}
+        for node in model.set_nodes:
+            node_block = model.node_blocks[node]
+            tec_blocks = [node_block.tech_blocks_active[tec] for tec in node_block.set_tecsAtNode]
+            for car in node_block.set_carriers:
+                tec_output_vars[node, car] = [b_tec.var_output for b_tec in tec_blocks
+                                              if car in b_tec.set_output_carriers]
+                tec_input_vars[node, car] = [b_tec.var_input for b_tec in tec_blocks
+                                             if car in b_tec.set_input_carriers]
+
         def init_energybalance(const, t, car, node):
             if car in model.node_blocks[node].set_carriers:
                 node_block = model.node_blocks[node]
-                tec_output = sum(
-                    node_block.tech_blocks_active[tec].var_output[t, car] for tec in node_block.set_tecsAtNode if
-                    car in node_block.tech_blocks_active[tec].set_output_carriers)
+                tec_output = quicksum(var_output[t, car] for var_output in tec_output_vars[node, car])
 
-                tec_input = sum(
-                    node_block.tech_blocks_active[tec].var_input[t, car] for tec in node_block.set_tecsAtNode if
-                    car in node_block.tech_blocks_active[tec].set_input_carriers)
+                tec_input = quicksum(var_input[t, car] for var_input in tec_input_vars[node, car])
 
                 netw_inflow = node_block.var_netw_inflow[t, car]
 
@@ -145,20 +154,22 @@ def add_emissionbalance(energyhub):
 
     # calculate total emissions from technologies, networks and importing/exporting carriers
     def init_emissions_pos(const):
-        from_technologies = sum(sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_pos[t] *
-                                        nr_timesteps_averaged
-                                        for t in set_t)
-                                    for tec in model.node_blocks[node].set_tecsAtNode)
-                                for node in model.set_nodes)
-        from_carriers = sum(sum(model.node_blocks[node].var_car_emissions_pos[t] *
-                                nr_timesteps_averaged
-                                for t in set_t)
-                            for node in model.set_nodes)
+        from_technologies = quicksum(
+            quicksum(
+                quicksum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_pos[t] *
+                         nr_timesteps_averaged
+                         for t in set_t)
+                for tec in model.node_blocks[node].set_tecsAtNode)
+            for node in model.set_nodes)
+        from_carriers = quicksum(quicksum(model.node_blocks[node].var_car_emissions_pos[t] *
+                                          nr_timesteps_averaged
+                                          for t in set_t)
+                                 for node in model.set_nodes)
         if not energyhub.configuration.energybalance.copperplate:
-            from_networks = sum(sum(model.network_block[netw].var_netw_emissions_pos[t] *
-                                    nr_timesteps_averaged
-                                    for t in set_t)
-                                for netw in model.set_networks)
+            from_networks = quicksum(quicksum(model.network_block[netw].var_netw_emissions_pos[t] *
+                                              nr_timesteps_averaged
+                                              for t in set_t)
+                                     for netw in model.set_networks)
         else:
             from_networks = 0
         return from_technologies + from_carriers + from_networks == model.var_emissions_pos
@@ -167,15 +178,17 @@ def add_emissionbalance(energyhub):
 
     # calculate negative emissions from technologies and import/export
     def init_emissions_neg(const):
-        from_technologies = sum(sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_neg[t] *
-                                        nr_timesteps_averaged
-                                        for t in set_t)
-                                    for tec in model.node_blocks[node].set_tecsAtNode)
-                                for node in model.set_nodes)
-        from_carriers = sum(sum(model.node_blocks[node].var_car_emissions_neg[t] *
-                                nr_timesteps_averaged
-                                for t in set_t)
-                            for node in model.set_nodes)
+        from_technologies = quicksum(
+            quicksum(
+                quicksum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_neg[t] *
+                         nr_timesteps_averaged
+                         for t in set_t)
+                for tec in model.node_blocks[node].set_tecsAtNode)
+            for node in model.set_nodes)
+        from_carriers = quicksum(quicksum(model.node_blocks[node].var_car_emissions_neg[t] *
+                                          nr_timesteps_averaged
+                                          for t in set_t)
+                                 for node in model.set_nodes)
         return from_technologies + from_carriers == model.var_emissions_neg
 
     model.const_emissions_neg = Constraint(rule=init_emissions_neg)
@@ -205,6 +218,8 @@ def add_system_costs(energyhub):
     # Delete previously initialized constraints
     if model.find_component('const_node_cost'):
         model.del_component(model.const_node_cost)
+        model.del_component(model.expr_node_cost)
+        model.del_component(model.expr_node_cost_at_node)
         if not energyhub.configuration.energybalance.copperplate:
             model.del_component(model.const_netw_cost)
         model.del_component(model.const_revenue_carbon)
@@ -217,50 +232,50 @@ def add_system_costs(energyhub):
     nr_timesteps_averaged = energyhub.model_information.averaged_data_specs.nr_timesteps_averaged
 
     # Cost at each node
-    def init_node_cost(const):
-        tec_capex = sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_capex
-                            for tec in model.node_blocks[node].set_tecsAtNode)
-                        for node in model.set_nodes)
+    # The costs are held in expressions (one per node and one for their sum), such that the constraint can be re-added
+    # to a persistent solver after changing (mutable) cost parameters without regenerating the sums, and the sum over
+    # all nodes is built from node level partial sums
+    def init_node_cost_at_node(expr, node):
+        node_block = model.node_blocks[node]
+        tec_blocks = [node_block.tech_blocks_active[tec] for tec in node_block.set_tecsAtNode]
 
-        tec_opex_variable = sum(sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_opex_variable[t] *
-                                        nr_timesteps_averaged
-                                        for tec in model.node_blocks[node].set_tecsAtNode)
-                                    for t in set_t)
-                                for node in model.set_nodes)
+        tec_capex = quicksum(b_tec.var_capex for b_tec in tec_blocks)
+
+        tec_opex_variable = quicksum(quicksum(b_tec.var_opex_variable[t] * nr_timesteps_averaged
+                                              for b_tec in tec_blocks)
+                                     for t in set_t)
 
-        tec_opex_fixed = sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_opex_fixed
-                                 for tec in model.node_blocks[node].set_tecsAtNode)
-                             for node in model.set_nodes)
+        tec_opex_fixed = quicksum(b_tec.var_opex_fixed for b_tec in tec_blocks)
 
-        import_cost = sum(sum(sum(model.node_blocks[node].var_import_flow[t, car] *
-                                  model.node_blocks[node].para_import_price[t, car] *
-                                  nr_timesteps_averaged
-                                  for car in model.node_blocks[node].set_carriers)
-                              for t in set_t)
-                          for node in model.set_nodes)
+        import_cost = quicksum(quicksum(node_block.var_import_flow[t, car] *
+                                        node_block.para_import_price[t, car] *
+                                        nr_timesteps_averaged
+                                        for car in node_block.set_carriers)
+                               for t in set_t)
 
-        export_revenue = sum(sum(sum(model.node_blocks[node].var_export_flow[t, car] *
-                                     model.node_blocks[node].para_export_price[t, car] *
-                                     nr_timesteps_averaged
-                                     for car in model.node_blocks[node].set_carriers)
-                                 for t in set_t)
-                             for node in model.set_nodes)
+        export_revenue = quicksum(quicksum(node_block.var_export_flow[t, car] *
+                                           node_block.para_export_price[t, car] *
+                                           nr_timesteps_averaged
+                                           for car in node_block.set_carriers)
+                                  for t in set_t)
 
-        return tec_capex + tec_opex_variable + tec_opex_fixed + import_cost - export_revenue == model.var_node_cost
+        return tec_capex + tec_opex_variable + tec_opex_fixed + import_cost - export_revenue
 
-    model.const_node_cost = Constraint(rule=init_node_cost)
+    model.expr_node_cost_at_node = Expression(model.set_nodes, rule=init_node_cost_at_node)
+    model.expr_node_cost = Expression(expr=quicksum(model.expr_node_cost_at_node[node] for node in model.set_nodes))
+    model.const_node_cost = Constraint(expr=model.expr_node_cost == model.var_node_cost)
 
     # Calculates network costs
     def init_netw_cost(const):
         if not energyhub.configuration.energybalance.copperplate:
-            netw_capex = sum(model.network_block[netw].var_capex
-                             for netw in model.set_networks)
-            netw_opex_variable = sum(sum(model.network_block[netw].var_opex_variable[t] *
-                                         nr_timesteps_averaged
-                                         for netw in model.set_networks)
-                                     for t in set_t)
-            netw_opex_fixed = sum(model.network_block[netw].var_opex_fixed
+            netw_capex = quicksum(model.network_block[netw].var_capex
                                   for netw in model.set_networks)
+            netw_opex_variable = quicksum(quicksum(model.network_block[netw].var_opex_variable[t] *
+                                                   nr_timesteps_averaged
+                                                   for netw in model.set_networks)
+                                          for t in set_t)
+            netw_opex_fixed = quicksum(model.network_block[netw].var_opex_fixed
+                                       for netw in model.set_networks)
             return netw_capex + netw_opex_variable + netw_opex_fixed == \
                    model.var_netw_cost
         else:
@@ -271,36 +286,43 @@ def add_system_costs(energyhub):
     if configuration.energybalance.violation >= 0:
         def init_violation_cost(const):
             return model.var_violation_cost == \
-                   sum(sum(sum(model.var_violation[t, car, node] for t in model.set_t_full) for car in model.set_carriers) \
-                       for node in model.set_nodes) * configuration.energybalance.violation
+                   quicksum(quicksum(quicksum(model.var_violation[t, car, node] for t in model.set_t_full)
+                                     for car in model.set_carriers)
+                            for node in model.set_nodes) * configuration.energybalance.violation
         model.const_violation_cost = Constraint(rule=init_violation_cost)
 
     # Calculate emission cost and revenues (if applicable)
 
     def init_carbon_revenue(const):
-        revenue_carbon_from_technologies = sum(sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_neg[t] *
-                                                        nr_timesteps_averaged * model.para_carbon_subsidy[t]
-                                                    for t in set_t)
-                                                for tec in model.node_blocks[node].set_tecsAtNode)
-                                            for node in model.set_nodes)
+        revenue_carbon_from_technologies = quicksum(
+            quicksum(
+                quicksum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_neg[t] *
+                         nr_timesteps_averaged * model.para_carbon_subsidy[t]
+                         for t in set_t)
+                for tec in model.node_blocks[node].set_tecsAtNode)
+            for node in model.set_nodes)
         return revenue_carbon_from_technologies == model.var_carbon_revenue
     model.const_revenue_carbon = Constraint(rule=init_carbon_revenue)
 
 
 
     def init_carbon_cost(const):
-        cost_carbon_from_technologies = sum(sum(sum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_pos[t] *
-                                                    nr_timesteps_averaged * model.para_carbon_tax[t]
-                                                for t in set_t)
-                                            for tec in model.node_blocks[node].set_tecsAtNode)
-                                        for node in model.set_nodes)
-        cost_carbon_from_carriers = sum(sum(model.node_blocks[node].var_car_emissions_pos[t] * nr_timesteps_averaged * model.para_carbon_tax[t]
-                                        for t in set_t)
-                                    for node in model.set_nodes)
+        cost_carbon_from_technologies = quicksum(
+            quicksum(
+                quicksum(model.node_blocks[node].tech_blocks_active[tec].var_tec_emissions_pos[t] *
+                         nr_timesteps_averaged * model.para_carbon_tax[t]
+                         for t in set_t)
+                for tec in model.node_blocks[node].set_tecsAtNode)
+            for node in model.set_nodes)
+        cost_carbon_from_carriers = quicksum(quicksum(model.node_blocks[node].var_car_emissions_pos[t] *
+                                                      nr_timesteps_averaged * model.para_carbon_tax[t]
+                                                      for t in set_t)
+                                             for node in model.set_nodes)
         if not configuration.energybalance.copperplate:
-            cost_carbon_from_networks = sum(sum(model.network_block[netw].var_netw_emissions_pos[t] * nr_timesteps_averaged * model.para_carbon_tax[t]
-                                            for t in set_t)
-                                        for netw in model.set_networks)
+            cost_carbon_from_networks = quicksum(quicksum(model.network_block[netw].var_netw_emissions_pos[t] *
+                                                          nr_timesteps_averaged * model.para_carbon_tax[t]
+                                                          for t in set_t)
+                                                 for netw in model.set_networks)
         else:
             cost_carbon_from_networks = 0
         return cost_carbon_from_technologies + cost_carbon_from_carriers + cost_carbon_from_networks == model.var_carbon_cost
@@ -247,37 +247,38 @@ def add_nodes(energyhub):
                                                        rule=init_export_emissions_neg)
 
         def init_car_emissions_pos(const, t):
-            return sum(b_node.var_import_emissions_pos[t, car] + b_node.var_export_emissions_pos[t, car]
-                    for car in b_node.set_carriers) \
+            return quicksum(b_node.var_import_emissions_pos[t, car] + b_node.var_export_emissions_pos[t, car]
+                         for car in b_node.set_carriers) \
                    == b_node.var_car_emissions_pos[t]
         b_node.const_car_emissions_pos = Constraint(set_t, rule=init_car_emissions_pos)
 
         def init_car_emissions_neg(const, t):
-            return sum(b_node.var_import_emissions_neg[t, car] + b_node.var_export_emissions_neg[t, car]
-                    for car in b_node.set_carriers) == \
+            return quicksum(b_node.var_import_emissions_neg[t, car] + b_node.var_export_emissions_neg[t, car]
+                         for car in b_node.set_carriers) == \
                    b_node.var_car_emissions_neg[t]
         b_node.const_car_emissions_neg = Constraint(set_t, rule=init_car_emissions_neg)
 
          # Define network constraints
         if not energyhub.configuration.energybalance.copperplate:
             def init_netw_inflow(const, t, car):
-                return b_node.var_netw_inflow[t,car] == sum(model.network_block[netw].var_inflow[t,car,nodename]
-                                                            for netw in model.set_networks
-                                                            if car in model.network_block[netw].set_netw_carrier)
+                return b_node.var_netw_inflow[t,car] == quicksum(model.network_block[netw].var_inflow[t,car,nodename]
+                                                                 for netw in model.set_networks
+                                                                 if car in model.network_block[netw].set_netw_carrier)
             b_node.const_netw_inflow = Constraint(set_t, b_node.set_carriers, rule=init_netw_inflow)
 
             def init_netw_outflow(const, t, car):
-                return b_node.var_netw_outflow[t,car] == sum(model.network_block[netw].var_outflow[t,car,nodename]
-                                                            for netw in model.set_networks
-                                                            if car in model.network_block[netw].set_netw_carrier)
+                return b_node.var_netw_outflow[t,car] == quicksum(model.network_block[netw].var_outflow[t,car,nodename]
+                                                                 for netw in model.set_networks
+                                                                 if car in model.network_block[netw].set_netw_carrier)
             b_node.const_netw_outflow = Constraint(set_t, b_node.set_carriers, rule=init_netw_outflow)
 
             if network_energy_consumption:
                 def init_netw_consumption(const, t, car):
-                    return b_node.var_netw_consumption[t,car] == sum(model.network_block[netw].var_consumption[t,car,nodename]
-                                                                for netw in model.set_networks
-                                                                 if data.network_data[netw].energy_consumption and
-                                                                     car in model.network_block[netw].set_consumed_carriers)
+                    return b_node.var_netw_consumption[t,car] == \
+                           quicksum(model.network_block[netw].var_consumption[t,car,nodename]
+                                    for netw in model.set_networks
+                                    if data.network_data[netw].energy_consumption and
+                                    car in model.network_block[netw].set_consumed_carriers)
                 b_node.const_netw_consumption = Constraint(set_t, b_node.set_carriers, rule=init_netw_consumption)
 
         # BLOCKS
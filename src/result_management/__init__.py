@@ -1,3 +1,3 @@
 from .save_results import write_optimization_results_to_h5
 from .read_results import *
-from .utilities import create_save_folder, create_unique_folder_name
\ No newline at end of file
+from .utilities import create_save_folder, create_unique_folder_name, write_summary_to_excel
\ No newline at end of file
@@ -1,4 +1,5 @@
 import h5py
+import numpy as np
 
 from .utilities import *
 
@@ -106,10 +107,11 @@ def write_optimization_results_to_h5(energyhub, folder_path):
         # TIME-INDEPENDENT RESULTS: NODES: specific node [g] within: specific technology [g]
         for node_name in model.set_nodes:
             node_specific_group = nodes_design.create_group(node_name)
+            node_data = model.node_blocks[node_name]
 
-            for tec_name in model.node_blocks[node_name].set_tecsAtNode:
+            for tec_name in node_data.set_tecsAtNode:
                 tec_group = node_specific_group.create_group(tec_name)
-                b_tec = model.node_blocks[node_name].tech_blocks_active[tec_name]
+                b_tec = node_data.tech_blocks_active[tec_name]
                 energyhub.data.technology_data[node_name][tec_name].write_tec_design_results_to_group(tec_group, b_tec)
 
         # TIME-DEPENDENT RESULTS (operation) [g]
@@ -128,40 +130,54 @@ def write_optimization_results_to_h5(energyhub, folder_path):
         tec_operation_group = operation.create_group("technology_operation")
         for node_name in model.set_nodes:
             node_specific_group = tec_operation_group.create_group(node_name)
-            for tec_name in model.node_blocks[node_name].set_tecsAtNode:
+            node_data = model.node_blocks[node_name]
+            for tec_name in node_data.set_tecsAtNode:
                 tec_group = node_specific_group.create_group(tec_name)
-                b_tec = model.node_blocks[node_name].tech_blocks_active[tec_name]
+                b_tec = node_data.tech_blocks_active[tec_name]
                 energyhub.data.technology_data[node_name][tec_name].write_tec_operation_results_to_group(tec_group, b_tec)
 
 
         # ENERGY BALANCE [g] > within: node > specific carrier [g]
+        nr_timesteps = len(set_t)
         ebalance_group = operation.create_group("energy_balance")
         for node_name in model.set_nodes:
             node_specific_group = ebalance_group.create_group(node_name)
-            for car in model.node_blocks[node_name].set_carriers:
+            node_data = model.node_blocks[node_name]
+            tec_blocks = {tec: node_data.tech_blocks_active[tec] for tec in node_data.set_tecsAtNode}
+            for car in node_data.set_carriers:
                 car_group = node_specific_group.create_group(car)
-                node_data = model.node_blocks[node_name]
-                technology_inputs = [sum(node_data.tech_blocks_active[tec].var_input[t, car].value
-                                         for tec in node_data.set_tecsAtNode
-                                         if car in node_data.tech_blocks_active[tec].set_input_carriers)
-                                     for t in set_t]
+                # collect the technology variables once, instead of looking them up in every time step
+                input_vars = [b_tec.var_input for b_tec in tec_blocks.values() if car in b_tec.set_input_carriers]
+                output_vars = [b_tec.var_output for b_tec in tec_blocks.values() if car in b_tec.set_output_carriers]
+                technology_inputs = np.fromiter((sum(var[t, car].value for var in input_vars) for t in set_t),
+                                                dtype=np.float64, count=nr_timesteps)
                 car_group.create_dataset("technology_inputs", data=technology_inputs)
-                technology_outputs = [sum(node_data.tech_blocks_active[tec].var_output[t, car].value
-                                          for tec in node_data.set_tecsAtNode
-                                          if car in node_data.tech_blocks_active[tec].set_output_carriers)
-                                      for t in set_t]
+                technology_outputs = np.fromiter((sum(var[t, car].value for var in output_vars) for t in set_t),
+                                                 dtype=np.float64, count=nr_timesteps)
                 car_group.create_dataset("technology_outputs", data=technology_outputs)
                 car_group.create_dataset("generic_production",
-                                         data=[node_data.var_generic_production[t, car].value for t in set_t])
+                                         data=np.fromiter((node_data.var_generic_production[t, car].value
+                                                           for t in set_t), dtype=np.float64, count=nr_timesteps))
                 car_group.create_dataset("network_inflow",
-                                         data=[0 if x is None else x for x in [node_data.var_netw_inflow[t, car].value for t in set_t]])
+                                         data=np.fromiter((0 if x is None else x for x in
+                                                           (node_data.var_netw_inflow[t, car].value for t in set_t)),
+                                                          dtype=np.float64, count=nr_timesteps))
                 car_group.create_dataset("network_outflow",
-                                         data=[0 if x is None else x for x in [node_data.var_netw_outflow[t, car].value for t in set_t]])
+                                         data=np.fromiter((0 if x is None else x for x in
+                                                           (node_data.var_netw_outflow[t, car].value for t in set_t)),
+                                                          dtype=np.float64, count=nr_timesteps))
                 if hasattr(node_data, 'var_netw_consumption'):
-                    network_consumption = [node_data.var_netw_consumption[t, car].value for t in set_t]
+                    network_consumption = np.fromiter((node_data.var_netw_consumption[t, car].value for t in set_t),
+                                                      dtype=np.float64, count=nr_timesteps)
                     car_group.create_dataset("network_consumption", data=network_consumption)
-                car_group.create_dataset("import", data=[node_data.var_import_flow[t, car].value for t in set_t])
-                car_group.create_dataset("export", data=[node_data.var_export_flow[t, car].value for t in set_t])
-                car_group.create_dataset("demand", data=[node_data.para_demand[t, car].value for t in set_t])
+                car_group.create_dataset("import",
+                                         data=np.fromiter((node_data.var_import_flow[t, car].value for t in set_t),
+                                                          dtype=np.float64, count=nr_timesteps))
+                car_group.create_dataset("export",
+                                         data=np.fromiter((node_data.var_export_flow[t, car].value for t in set_t),
+                                                          dtype=np.float64, count=nr_timesteps))
+                car_group.create_dataset("demand",
+                                         data=np.fromiter((node_data.para_demand[t, car].value for t in set_t),
+                                                          dtype=np.float64, count=nr_timesteps))
 
     return summary_dict
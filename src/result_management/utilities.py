@@ -1,6 +1,9 @@
 from datetime import datetime
+import math
 import os
 from pathlib import Path
+import pandas as pd
+from openpyxl import Workbook
 
 
 def create_unique_folder_name(path, name):
@@ -28,6 +31,33 @@ def create_save_folder(save_path):
     os.makedirs(save_path)
 
 
+def write_summary_to_excel(summary_dict, save_summary_path):
+    """
+    Appends the summary of an optimization run to the summary excel file at save_summary_path. If the file does not
+    exist yet, it is created.
+
+    The file is written with a write-only openpyxl workbook, row by row.
+
+    :param dict summary_dict: summary of the optimization run
+    :param Path save_summary_path: path of the summary excel file
+    :return:
+    """
+    summary_df = pd.DataFrame(data=summary_dict, index=[0])
+    if os.path.exists(save_summary_path):
+        summary_df = pd.concat([pd.read_excel(save_summary_path), summary_df])
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Summary")
+    ws.append(list(summary_df.columns))
+    for row in summary_df.itertuples(index=False, name=None):
+        # as in pandas (na_rep, inf_rep), missing values are written as empty cells and infinite values as strings
+        ws.append([None if pd.isna(value) else
+                   ('inf' if value > 0 else '-inf') if isinstance(value, float) and math.isinf(value) else
+                   value
+                   for value in row])
+    wb.save(save_summary_path)
+
+
 def calculate_tec_cost(energyhub):
     """
     Calculates costs related to technologies
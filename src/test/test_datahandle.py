@@ -69,3 +69,93 @@ def test_load_technologies():
             continue
         else:
             continue
+
+@pytest.mark.quicktest
+def test_pprint(capsys):
+    """
+    Tests the printed summary of the input data for a small topology with a new and an existing network
+    """
+    topology = SystemTopology()
+    topology.define_time_horizon(year=2001, start_date='01-01 00:00', end_date='01-01 03:00', resolution=1)
+    topology.define_carriers(['heat'])
+    topology.define_nodes({'onshore': {}, 'offshore': {}})
+    topology.define_new_technologies('onshore', ['Furnace_NG', 'Photovoltaic'])
+
+    distance = create_empty_network_matrix(topology.nodes)
+    distance.at['onshore', 'offshore'] = 100
+    distance.at['offshore', 'onshore'] = 100
+
+    connection = create_empty_network_matrix(topology.nodes)
+    connection.at['onshore', 'offshore'] = 1
+    connection.at['offshore', 'onshore'] = 1
+    topology.define_new_network('electricitySimple', distance=distance, connections=connection)
+
+    size = create_empty_network_matrix(topology.nodes)
+    size.at['onshore', 'offshore'] = 5
+    topology.define_existing_network('hydrogenTest', size=size, distance=distance)
+
+    data = DataHandle(topology)
+    data.read_demand_data('onshore', 'heat', [10, 11, 12, 13.333])
+    data.read_import_price_data('offshore', 'heat', [50, 60, 70, 80])
+    data.pprint()
+
+    expected = [
+        '----- SET OF CARRIERS -----',
+        '- heat',
+        '----- NODE DATA -----',
+        '\t -----------------------------------------------------',
+        '\t Nodename: onshore',
+        '\t\tNew technologies:',
+        '\t\t - Furnace_NG',
+        '\t\t - Photovoltaic',
+        '\t\tExisting technologies:',
+        '\t\tOther Node data:',
+        '\t\t\tAverage of demand:',
+        '\t\t\t - heat: 11.58',
+        '\t\t\tAverage of production_profile:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of import_prices:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of import_limit:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of import_emissionfactors:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of export_prices:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of export_limit:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of export_emissionfactors:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of climate_data:',
+        '\t -----------------------------------------------------',
+        '\t Nodename: offshore',
+        '\t\tNew technologies:',
+        '\t\tExisting technologies:',
+        '\t\tOther Node data:',
+        '\t\t\tAverage of demand:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of production_profile:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of import_prices:',
+        '\t\t\t - heat: 65.0',
+        '\t\t\tAverage of import_limit:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of import_emissionfactors:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of export_prices:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of export_limit:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of export_emissionfactors:',
+        '\t\t\t - heat: 0.0',
+        '\t\t\tAverage of climate_data:',
+        '----- NETWORK DATA -----',
+        '\t -----------------------------------------------------',
+        '\telectricitySimple',
+        '\t\t\tonshore - offshore',
+        '\t\t\toffshore - onshore',
+        '\t -----------------------------------------------------',
+        '\thydrogenTest',
+        '\t\t\tonshore - offshore',
+    ]
+    assert capsys.readouterr().out.splitlines() == expected
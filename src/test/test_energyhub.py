@@ -7,6 +7,63 @@ from src.model_configuration import ModelConfiguration
 from src.components.utilities import annualize
 from src.data_management import *
 from src.energyhub import EnergyHub as ehub
+from src.model_construction import add_system_costs
+from src.result_management import write_summary_to_excel
+
+def create_energyhub_sample(save_path, gas_prices=None):
+    """
+    Create a constructed (not solved) model with a gas furnace and a heat demand at each node
+
+    :param save_path: save path of the configuration
+    :param dict gas_prices: gas import price at each node, defaults to a single node test_node1 with a price of 1
+    """
+    if gas_prices is None:
+        gas_prices = {'test_node1': 1}
+
+    topology = SystemTopology()
+    topology.define_time_horizon(year=2001, start_date='01-01 00:00', end_date='01-01 03:00', resolution=1)
+    topology.define_carriers(['heat', 'gas'])
+    topology.define_nodes({node: {} for node in gas_prices})
+    for node in gas_prices:
+        topology.define_new_technologies(node, ['Furnace_NG'])
+
+    data = DataHandle(topology)
+    for node in gas_prices:
+        data.read_demand_data(node, 'heat', [10] * 4)
+        data.read_import_price_data(node, 'gas', [gas_prices[node]] * 4)
+        data.read_import_limit_data(node, 'gas', [100] * 4)
+    data.read_technology_data(load_path='./src/test/TestTecs')
+    data.read_network_data(load_path='./src/test/TestNetworks')
+
+    configuration = ModelConfiguration()
+    configuration.reporting.save_path = save_path
+    energyhub = ehub(data, configuration)
+    energyhub.construct_model()
+    energyhub.construct_balances()
+    return energyhub
+
+def calculate_node_cost(energyhub, node):
+    """
+    Calculates the cost at a node from the current variable and parameter values as a flat sum over technologies,
+    time steps and carriers
+    """
+    model = energyhub.model
+    set_t = model.set_t_full
+    nr_timesteps_averaged = energyhub.model_information.averaged_data_specs.nr_timesteps_averaged
+    b_node = model.node_blocks[node]
+
+    node_cost = 0
+    for tec in b_node.set_tecsAtNode:
+        b_tec = b_node.tech_blocks_active[tec]
+        node_cost += b_tec.var_capex.value + b_tec.var_opex_fixed.value
+        node_cost += sum(b_tec.var_opex_variable[t].value for t in set_t) * nr_timesteps_averaged
+    for t in set_t:
+        for car in b_node.set_carriers:
+            node_cost += b_node.var_import_flow[t, car].value * value(b_node.para_import_price[t, car]) * \
+                         nr_timesteps_averaged
+            node_cost -= b_node.var_export_flow[t, car].value * value(b_node.para_export_price[t, car]) * \
+                         nr_timesteps_averaged
+    return node_cost
 
 @pytest.mark.quicktest
 def test_initializer():
@@ -385,5 +442,118 @@ def test_scaling():
     energyhub.quick_solve()
     assert energyhub.solution.solver.termination_condition == 'optimal'
 
+@pytest.mark.quicktest
+def test_write_summary_to_excel(tmp_path):
+    """
+    Writes the summary of two runs to the same file, both rows need to be read back completely, including infinite
+    bounds
+    """
+    save_summary_path = tmp_path / 'Summary.xlsx'
+    summary_run1 = {'total_costs': 10.0, 'net_emissions': 5.0, 'objective': 'costs',
+                    'lb': -np.inf, 'absolute gap': np.inf}
+    summary_run2 = {'total_costs': 20.0, 'net_emissions': 2.5, 'objective': 'emissions_net',
+                    'lb': 19.5, 'absolute gap': 0.5}
+    write_summary_to_excel(summary_run1, save_summary_path)
+    write_summary_to_excel(summary_run2, save_summary_path)
+
+    summary = pd.read_excel(save_summary_path, sheet_name='Summary')
+    assert summary.to_dict('records') == [summary_run1, summary_run2]
+
+@pytest.mark.quicktest
+def test_write_summary_to_excel_new_columns(tmp_path):
+    """
+    Appends a run with an additional column, the missing value of the earlier run is written as an empty cell
+    """
+    save_summary_path = tmp_path / 'Summary.xlsx'
+    write_summary_to_excel({'total_costs': 10.0, 'time_stamp': 'run1'}, save_summary_path)
+    write_summary_to_excel({'total_costs': 20.0, 'time_stamp': 'run2', 'pareto_point': 1}, save_summary_path)
+
+    summary = pd.read_excel(save_summary_path, sheet_name='Summary')
+    assert list(summary.columns) == ['total_costs', 'time_stamp', 'pareto_point']
+    assert list(summary['total_costs']) == [10.0, 20.0]
+    assert list(summary['time_stamp']) == ['run1', 'run2']
+    assert pd.isna(summary.at[0, 'pareto_point'])
+    assert summary.at[1, 'pareto_point'] == 1
 
+@pytest.mark.quicktest
+def test_emission_limit(tmp_path):
+    """
+    Sets the emission limit twice, the constraint is kept and its bound follows the mutable parameter
+    """
+    energyhub = create_energyhub_sample(tmp_path)
+    energyhub._set_emission_limit(100)
+    const_emission_limit = energyhub.model.const_emission_limit
+    assert value(const_emission_limit.upper) == 100
 
+    energyhub._set_emission_limit(50)
+    assert energyhub.model.const_emission_limit is const_emission_limit
+    assert value(energyhub.model.para_emission_limit) == 50
+    assert value(const_emission_limit.upper) == 50
+
+@pytest.mark.quicktest
+def test_node_cost_after_price_change(tmp_path):
+    """
+    Changes the import price after the model is constructed, the node cost constraint needs to hold the new price and
+    equal the sum over all nodes, technologies, time steps and carriers
+    """
+    energyhub = create_energyhub_sample(tmp_path)
+    model = energyhub.model
+    set_t = model.set_t_full
+    for var in model.component_data_objects(Var):
+        var.set_value(1, skip_validation=True)
+
+    node_cost_initial = calculate_node_cost(energyhub, 'test_node1')
+    assert value(model.const_node_cost.body) == pytest.approx(node_cost_initial - model.var_node_cost.value)
+
+    b_node = model.node_blocks['test_node1']
+    for t in set_t:
+        b_node.para_import_price[t, 'gas'] = 5
+    node_cost_updated = calculate_node_cost(energyhub, 'test_node1')
+    assert node_cost_updated == pytest.approx(node_cost_initial + 4 * len(set_t))
+    assert value(model.const_node_cost.body) == pytest.approx(node_cost_updated - model.var_node_cost.value)
+
+@pytest.mark.quicktest
+def test_node_cost_at_node(tmp_path):
+    """
+    Two nodes with different gas prices: the cost expression at each node needs to hold the cost of that node, and the
+    node cost their sum, also after the system costs are constructed again
+    """
+    energyhub = create_energyhub_sample(tmp_path, gas_prices={'test_node1': 1, 'test_node2': 3})
+    for var in energyhub.model.component_data_objects(Var):
+        var.set_value(1, skip_validation=True)
+
+    node_costs = {node: calculate_node_cost(energyhub, node) for node in energyhub.model.set_nodes}
+    assert node_costs['test_node2'] == pytest.approx(node_costs['test_node1'] + 2 * len(energyhub.model.set_t_full))
+
+    for model in [energyhub.model, add_system_costs(energyhub)]:
+        for node in model.set_nodes:
+            assert value(model.expr_node_cost_at_node[node]) == pytest.approx(node_costs[node])
+        assert value(model.expr_node_cost) == pytest.approx(sum(node_costs.values()))
+
+class EnergyHubSavedWithoutSlots:
+    """
+    Pickles like an EnergyHub instance saved before EnergyHub declared __slots__, i.e. with the instance dict as state
+    """
+    def __init__(self, state):
+        self.state = state
+
+    def __reduce_ex__(self, protocol):
+        return ehub.__new__, (ehub,), self.state
+
+@pytest.mark.quicktest
+def test_load_energyhub(tmp_path):
+    """
+    Saves and loads an energyhub instance, and loads an instance pickled with its attributes in a plain dict
+    """
+    energyhub = create_energyhub_sample(tmp_path)
+    energyhub.save_model(tmp_path, 'energyhub.p')
+    energyhub_loaded = load_object(tmp_path / 'energyhub.p')
+    assert list(energyhub_loaded.model.set_nodes) == ['test_node1']
+    assert energyhub_loaded.configuration.reporting.save_path == tmp_path
+
+    save_object(EnergyHubSavedWithoutSlots({'solution': None, 'solver': None, 'topology': energyhub.topology}),
+                tmp_path / 'energyhub_without_slots.p')
+    energyhub_loaded = load_object(tmp_path / 'energyhub_without_slots.p')
+    assert isinstance(energyhub_loaded, ehub)
+    assert energyhub_loaded.solution is None
+    assert list(energyhub_loaded.topology.nodes) == ['test_node1']